@@ -0,0 +1,100 @@
+/* ****************************************************************************
+ *       Copyright (C) 2019 the sage-numerical-backends-cplex authors
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 2 of the License, or
+ * (at your option) any later version.
+ *                  https://www.gnu.org/licenses/
+ * ****************************************************************************/
+
+#include "_cplex_fast.h"
+
+int cplex_fast_fill_pairs(PyObject *pairs, int *ind, double *val)
+{
+    PyObject *fast;
+    Py_ssize_t n, i;
+
+    fast = PySequence_Fast(pairs, "coefficients must be an iterable of pairs");
+    if (!fast)
+        return -1;
+
+    n = PySequence_Fast_GET_SIZE(fast);
+    for (i = 0; i < n; i++) {
+        PyObject *pair;
+        long j;
+        double c;
+
+        pair = PySequence_Fast(PySequence_Fast_GET_ITEM(fast, i),
+                               "coefficients must be (index, value) pairs");
+        if (!pair) {
+            Py_DECREF(fast);
+            return -1;
+        }
+        if (PySequence_Fast_GET_SIZE(pair) != 2) {
+            PyErr_SetString(PyExc_ValueError,
+                            "coefficients must be (index, value) pairs");
+            Py_DECREF(pair);
+            Py_DECREF(fast);
+            return -1;
+        }
+
+        j = PyLong_AsLong(PySequence_Fast_GET_ITEM(pair, 0));
+        c = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(pair, 1));
+        Py_DECREF(pair);
+        if (PyErr_Occurred()) {
+            Py_DECREF(fast);
+            return -1;
+        }
+
+        ind[i] = (int) j;
+        val[i] = c;
+    }
+
+    Py_DECREF(fast);
+    return (int) n;
+}
+
+int cplex_fast_fill_lists(PyObject *indices, PyObject *values, int *ind, double *val)
+{
+    PyObject *fast_ind, *fast_val;
+    Py_ssize_t n, i;
+
+    fast_ind = PySequence_Fast(indices, "indices must be iterable");
+    if (!fast_ind)
+        return -1;
+    fast_val = PySequence_Fast(values, "values must be iterable");
+    if (!fast_val) {
+        Py_DECREF(fast_ind);
+        return -1;
+    }
+
+    n = PySequence_Fast_GET_SIZE(fast_ind);
+    if (PySequence_Fast_GET_SIZE(fast_val) != n) {
+        PyErr_SetString(PyExc_ValueError,
+                        "indices and values must have the same length");
+        Py_DECREF(fast_ind);
+        Py_DECREF(fast_val);
+        return -1;
+    }
+
+    for (i = 0; i < n; i++) {
+        long j;
+        double c;
+
+        j = PyLong_AsLong(PySequence_Fast_GET_ITEM(fast_ind, i));
+        c = PyFloat_AsDouble(PySequence_Fast_GET_ITEM(fast_val, i));
+        if (PyErr_Occurred()) {
+            Py_DECREF(fast_ind);
+            Py_DECREF(fast_val);
+            return -1;
+        }
+
+        ind[i] = (int) j;
+        val[i] = c;
+    }
+
+    Py_DECREF(fast_ind);
+    Py_DECREF(fast_val);
+    return (int) n;
+}
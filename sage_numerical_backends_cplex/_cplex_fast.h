@@ -0,0 +1,31 @@
+/* ****************************************************************************
+ *       Copyright (C) 2019 the sage-numerical-backends-cplex authors
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 2 of the License, or
+ * (at your option) any later version.
+ *                  https://www.gnu.org/licenses/
+ * ****************************************************************************/
+
+/* Plain-C helpers for the hot marshalling loops of cplex_backend.pyx.
+ * Keeping them in a separate translation unit keeps the generated Cython
+ * code on the Python/CPLEX boundary and lets the compiler optimize these
+ * loops without the surrounding _Pyx_* machinery. */
+
+#ifndef SAGE_NUMERICAL_BACKENDS_CPLEX_FAST_H
+#define SAGE_NUMERICAL_BACKENDS_CPLEX_FAST_H
+
+#include <Python.h>
+
+/* Fill ind/val from a Python sequence of (index, value) pairs.
+ * The buffers must hold at least len(pairs) entries.
+ * Returns the number of entries, or -1 with a Python exception set. */
+int cplex_fast_fill_pairs(PyObject *pairs, int *ind, double *val);
+
+/* Fill ind/val from two parallel Python sequences of indices and values.
+ * The buffers must hold at least len(indices) entries.
+ * Returns the number of entries, or -1 with a Python exception set. */
+int cplex_fast_fill_lists(PyObject *indices, PyObject *values, int *ind, double *val);
+
+#endif
@@ -11,6 +11,10 @@
 
 from sage.numerical.backends.generic_backend cimport GenericBackend
 
+cdef extern from "_cplex_fast.h":
+    int cplex_fast_fill_pairs(object pairs, int *ind, double *val) except -1
+    int cplex_fast_fill_lists(object indices, object values, int *ind, double *val) except -1
+
 cdef extern from "stdio.h":
     ctypedef struct FILE
     FILE * fopen (const char * filename, const char * opentype)
@@ -28,9 +32,22 @@ cdef class CPLEXBackend(GenericBackend):
     cdef c_cpxlp * lp
     cdef current_sol
     cdef str _logfilename
+    cdef double * _x_cache
+    cdef int _x_cache_n
+    cdef bint _x_cache_valid
     cpdef __copy__(self)
+    cdef _invalidate_solution_cache(self)
+    cdef _refresh_solution_cache(self)
+    cpdef reserve(self, int nvars, int nrows, int nnz=*)
+    cpdef _add_linear_constraint_mv(self, int[::1] indices, double[::1] coeffs, lower_bound, upper_bound, name=*)
+    cpdef add_linear_constraints_matrix(self, int[::1] rmatbeg, int[::1] rmatind, double[::1] rmatval, double[::1] rhs, senses)
 
-cdef extern from "cplex.h":
+cpdef CPLEXBackend new_backend()
+
+# The CPLEX entry points are declared nogil: they are pure C, and the long
+# running ones (CPXmipopt, CPXlpopt, bulk loads) are called with the GIL
+# released so that concurrent threads are not serialized behind a solve.
+cdef extern from "cplex.h" nogil:
 
      # Create problem
      c_cpxlp * CPXcreateprob(c_cpxenv *  env, int *status_p,
@@ -46,6 +63,9 @@ cdef extern from "cplex.h":
      # Remove constraints
      int CPXdelrows(c_cpxenv * env, c_cpxlp * lp, int begin, int end)
 
+     # Remove columns
+     int CPXdelcols(c_cpxenv * env, c_cpxlp * lp, int begin, int end)
+
      # Solve MILP
      int CPXmipopt(c_cpxenv * env, c_cpxlp * lp)
 
@@ -226,7 +246,7 @@ cdef extern from "cplex.h":
      int CPX_MAX = -1
      int CPX_MIN = 1
 
-cdef extern from "cpxconst.h":
+cdef extern from "cpxconst.h" nogil:
 
      # Solution quality
      #
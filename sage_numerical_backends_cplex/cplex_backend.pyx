@@ -17,6 +17,7 @@ AUTHORS:
 #                  http://www.gnu.org/licenses/
 # *****************************************************************************
 
+from cpython.pycapsule cimport PyCapsule_New
 from cysignals.memory cimport sig_malloc, sig_free
 
 from sage.cpython.string cimport char_to_str, str_to_bytes
@@ -64,6 +65,39 @@ cdef class CPLEXBackend(GenericBackend):
 
         self.obj_constant_term = 0.0
         self._logfilename = ''
+        self._x_cache = NULL
+        self._x_cache_n = 0
+        self._x_cache_valid = False
+
+    cdef _invalidate_solution_cache(self):
+        r"""
+        Mark the cached solution vector as stale.
+
+        Called by every method that modifies the problem, so that values
+        cached by :meth:`solve` are never served for an outdated model.
+        """
+        self._x_cache_valid = False
+
+    cdef _refresh_solution_cache(self):
+        r"""
+        Fetch the complete solution vector from CPLEX.
+
+        A single ``CPXgetx`` call retrieving all variables is much cheaper
+        than one call per variable, as CPLEX performs per-call setup work.
+        """
+        cdef int status
+        cdef int n = CPXgetnumcols(self.env, self.lp)
+        if n > self._x_cache_n:
+            sig_free(self._x_cache)
+            self._x_cache = <double *> sig_malloc(n * sizeof(double))
+        # _x_cache_n is the number of valid entries, not the capacity, so
+        # that stale values are never served after the problem shrank.
+        self._x_cache_n = n
+        if n > 0:
+            with nogil:
+                status = CPXgetx(self.env, self.lp, self._x_cache, 0, n - 1)
+            check(status)
+        self._x_cache_valid = True
 
     cpdef int add_variable(self, lower_bound=0.0, upper_bound=None, binary=False, continuous=False, integer=False, obj=0.0, name=None) except -1:
         """
@@ -124,33 +158,33 @@ cdef class CPLEXBackend(GenericBackend):
         elif vtype != 1:
             raise ValueError("Exactly one parameter of 'binary', 'integer' and 'continuous' must be 'True'.")
 
+        self._invalidate_solution_cache()
+
+        # A single CPXnewcols transaction sets the objective coefficient,
+        # the bounds and the type at once, instead of separate CPXchgobj /
+        # CPXchgbds / CPXchgctype calls overwriting the defaults.
         cdef int status
-        status = CPXnewcols(self.env, self.lp, 1, NULL, NULL, NULL, NULL, NULL)
+        cdef double c_lb = lower_bound if lower_bound is not None else -CPX_INFBOUND
+        cdef double c_ub = upper_bound if upper_bound is not None else +CPX_INFBOUND
+        cdef char c_type = 'C'
+        if binary:
+            c_type = 'B'
+        elif integer:
+            c_type = 'I'
+
+        status = CPXnewcols(self.env, self.lp, 1, &c_coeff, &c_lb, &c_ub,
+                            NULL if continuous else &c_type, NULL)
         check(status)
 
         cdef int n
         n = CPXgetnumcols(self.env, self.lp) - 1
 
-        if lower_bound != 0.0:
-            self.variable_lower_bound(n, lower_bound)
-        if upper_bound is not None:
-            self.variable_upper_bound(n, upper_bound)
-
-        if binary:
-            self.set_variable_type(n,0)
-        elif integer:
-            self.set_variable_type(n,1)
-
         if name is not None:
             name = str_to_bytes(name)
             c_name = name
             status = CPXchgcolname(self.env, self.lp, 1, &n, &c_name)
             check(status)
 
-        if c_coeff:
-            status = CPXchgobj(self.env, self.lp, 1, &n, &c_coeff)
-            check(status)
-
         return n
 
     cpdef int add_variables(self, int number, lower_bound=0.0, upper_bound=None, binary=False, continuous=False, integer=False, obj=0.0, names=None) except -1:
@@ -205,51 +239,150 @@ cdef class CPLEXBackend(GenericBackend):
             'a'
             sage: p.objective_coefficient(5) # tol 1e-8
             42.0
+
+        A short list of names is rejected before any column is created
+        (with boundscheck disabled, the fill loop below must not index
+        past the end of the list)::
+
+            sage: p.add_variables(2, names=['onlyone'])
+            Traceback (most recent call last):
+            ...
+            ValueError: The 'names' list must contain at least 'number' entries.
+            sage: p.ncols()
+            7
         """
-        cdef char * c_name
         cdef double c_coeff = obj
         cdef int vtype = int(bool(binary)) + int(bool(continuous)) + int(bool(integer))
         if  vtype == 0:
             continuous = True
         elif vtype != 1:
             raise ValueError("Exactly one parameter of 'binary', 'integer' and 'continuous' must be 'True'.")
+        if names is not None and len(names) < number:
+            raise ValueError("The 'names' list must contain at least 'number' entries.")
+
+        self._invalidate_solution_cache()
 
         cdef int numcols_before
         numcols_before = CPXgetnumcols(self.env, self.lp)
 
+        # Issue a single CPXnewcols transaction carrying the objective
+        # coefficients, bounds and types of all new columns, instead of a
+        # CPXchgobj/CPXchgbds/CPXchgctype round trip per column.
         cdef int status
-        status = CPXnewcols(self.env, self.lp, number, NULL, NULL, NULL, NULL, NULL)
+        cdef int i
+        cdef double c_lb = lower_bound if lower_bound is not None else -CPX_INFBOUND
+        cdef double c_ub = upper_bound if upper_bound is not None else +CPX_INFBOUND
+        cdef char c_type = 'C'
+        if binary:
+            c_type = 'B'
+        elif integer:
+            c_type = 'I'
+
+        cdef double * obj_array = <double *> sig_malloc(number * sizeof(double))
+        cdef double * lb_array = <double *> sig_malloc(number * sizeof(double))
+        cdef double * ub_array = <double *> sig_malloc(number * sizeof(double))
+        cdef char * type_array = NULL
+        if not continuous:
+            type_array = <char *> sig_malloc(number * sizeof(char))
+
+        with nogil:
+            for 0<= i < number:
+                obj_array[i] = c_coeff
+                lb_array[i] = c_lb
+                ub_array[i] = c_ub
+                if type_array != NULL:
+                    type_array[i] = c_type
+
+            status = CPXnewcols(self.env, self.lp, number, obj_array, lb_array, ub_array,
+                                type_array, NULL)
+
+        sig_free(obj_array)
+        sig_free(lb_array)
+        sig_free(ub_array)
+        sig_free(type_array)
         check(status)
 
         cdef int n
         n = CPXgetnumcols(self.env, self.lp) - 1
 
-        cdef int i, j
+        cdef int * c_indices
+        cdef char ** c_names
+        if names:
+            # Keep the bytes objects alive until after the call.
+            b_names = [str_to_bytes(name) for name in names]
+            c_indices = <int *> sig_malloc(number * sizeof(int))
+            c_names = <char **> sig_malloc(number * sizeof(char *))
+            for 0<= i < number:
+                c_indices[i] = numcols_before + i
+                c_names[i] = b_names[i]
+            status = CPXchgcolname(self.env, self.lp, number, c_indices, c_names)
+            sig_free(c_indices)
+            sig_free(c_names)
+            check(status)
 
-        for 0<= i < number:
-            j = numcols_before + i
+        return n
 
-            if lower_bound != 0.0:
-                self.variable_lower_bound(j, lower_bound)
-            if upper_bound is not None:
-                self.variable_upper_bound(j, upper_bound)
+    cpdef reserve(self, int nvars, int nrows, int nnz=0) noexcept:
+        r"""
+        Hint the final size of the problem to CPLEX.
+
+        CPLEX grows its internal row and column tables on each add, so
+        building a model with many small ``add_variable`` /
+        ``add_linear_constraint`` calls triggers repeated internal
+        reallocation.  When the final sizes are known up front (as in
+        most MILP generators), calling this method once performs a
+        single bulk allocation by creating ``nvars`` placeholder columns
+        and ``nrows`` placeholder rows and deleting them again, leaving
+        the problem unchanged but the tables pre-sized.
+
+        This is purely an optimization hint; it never changes the
+        problem.  Hints smaller than the current size are ignored.
+        Like any other problem modification, it makes CPLEX discard a
+        previously computed solution, so the cached solution values are
+        invalidated as well.
 
-            if binary:
-                self.set_variable_type(j, 0)
-            elif integer:
-                self.set_variable_type(j, 1)
+        INPUT:
 
-            if names:
-                name = str_to_bytes(names[i])
-                c_name = name
-                status = CPXchgcolname(self.env, self.lp, 1, &j, &c_name)
-                check(status)
+        - ``nvars`` (integer) -- the expected total number of variables
 
-            if c_coeff:
-                status = CPXchgobj(self.env, self.lp, 1, &j, &c_coeff)
-                check(status)
+        - ``nrows`` (integer) -- the expected total number of constraints
 
-        return n
+        - ``nnz`` (integer) -- the expected total number of nonzero
+          coefficients (default: 0; accepted for callers that know it,
+          but only the row/column tables are pre-sized)
+
+        EXAMPLES::
+
+            sage: from sage_numerical_backends_cplex.cplex_backend import CPLEXBackend
+            sage: p = CPLEXBackend()
+            sage: p.reserve(100, 50, 1000)
+            sage: p.ncols(), p.nrows()
+            (0, 0)
+            sage: p.add_variable()
+            0
+        """
+        # The placeholder add/delete below counts as a problem
+        # modification, so CPLEX discards any existing solution.
+        self._invalidate_solution_cache()
+
+        cdef int status
+        cdef int ncols_now = CPXgetnumcols(self.env, self.lp)
+        cdef int nrows_now = CPXgetnumrows(self.env, self.lp)
+        cdef int extra
+
+        extra = nvars - ncols_now
+        if extra > 0:
+            status = CPXnewcols(self.env, self.lp, extra, NULL, NULL, NULL, NULL, NULL)
+            check(status)
+            status = CPXdelcols(self.env, self.lp, ncols_now, ncols_now + extra - 1)
+            check(status)
+
+        extra = nrows - nrows_now
+        if extra > 0:
+            status = CPXnewrows(self.env, self.lp, extra, NULL, NULL, NULL, NULL)
+            check(status)
+            status = CPXdelrows(self.env, self.lp, nrows_now, nrows_now + extra - 1)
+            check(status)
 
     cpdef set_variable_type(self, int variable, int vtype) noexcept:
         r"""
@@ -278,6 +411,8 @@ cdef class CPLEXBackend(GenericBackend):
             True
         """
 
+        self._invalidate_solution_cache()
+
         cdef int status
 
         cdef char type
@@ -313,6 +448,7 @@ cdef class CPLEXBackend(GenericBackend):
             False
         """
 
+        self._invalidate_solution_cache()
         CPXchgobjsen(self.env, self.lp, -sense)
 
     cpdef objective_coefficient(self, int variable, coeff=None) noexcept:
@@ -348,6 +484,7 @@ cdef class CPLEXBackend(GenericBackend):
             return value
 
         else:
+            self._invalidate_solution_cache()
             value = coeff
             status = CPXchgobj(self.env, self.lp, 1, &variable, &value)
             check(status)
@@ -422,6 +559,8 @@ cdef class CPLEXBackend(GenericBackend):
             9.0
         """
 
+        self._invalidate_solution_cache()
+
         cdef int status
         cdef int n = self.ncols()
         cdef double * c_coeff = <double *> sig_malloc(n * sizeof(double))
@@ -490,6 +629,7 @@ cdef class CPLEXBackend(GenericBackend):
             sage: p.get_values([x,y])
             [0, 3]
         """
+        self._invalidate_solution_cache()
         cdef int status
         status = CPXdelrows(self.env, self.lp, i, i)
         check(status)
@@ -520,9 +660,23 @@ cdef class CPLEXBackend(GenericBackend):
             sage: p.row_bounds(4)
             (None, 2.0)
             sage: p.add_linear_constraints(2, None, 2, names=['foo','bar'])
+
+        TESTS:
+
+        A short list of names is rejected (with boundscheck disabled, the
+        fill loop below must not index past the end of the list)::
+
+            sage: p.add_linear_constraints(2, None, 2, names=['foo'])
+            Traceback (most recent call last):
+            ...
+            ValueError: The 'names' list must contain at least 'number' entries.
         """
         if lower_bound is None and upper_bound is None:
             raise ValueError("At least one of 'upper_bound' or 'lower_bound' must be set.")
+        if names is not None and len(names) < number:
+            raise ValueError("The 'names' list must contain at least 'number' entries.")
+
+        self._invalidate_solution_cache()
 
         cdef int status
         cdef char * sense = <char *> sig_malloc(number * sizeof(char))
@@ -608,9 +762,12 @@ cdef class CPLEXBackend(GenericBackend):
         if lower_bound is None and upper_bound is None:
             raise ValueError("At least one of 'upper_bound' or 'lower_bound' must be set.")
 
+        self._invalidate_solution_cache()
+
         coefficients = list(coefficients)
         cdef int status
-        cdef int i, j
+        cdef int i
+        cdef int nz
         cdef int n = len(coefficients)
         cdef int nrows = self.nrows()
         cdef char sense
@@ -619,19 +776,24 @@ cdef class CPLEXBackend(GenericBackend):
 
         cdef double * c_coeff
         cdef int * c_indices
-        cdef int * c_row
+        cdef int rmatbeg = 0
         cdef double bound
         cdef double rng
-        cdef double c
 
         c_coeff = <double *> sig_malloc(n * sizeof(double))
         c_indices = <int *> sig_malloc(n * sizeof(int))
-        c_row = <int *> sig_malloc(n * sizeof(int))
 
-        for i, (j, c) in enumerate(coefficients):
-            c_coeff[i] = c
-            c_indices[i] = j
-            c_row[i] = nrows
+        cplex_fast_fill_pairs(coefficients, c_indices, c_coeff)
+
+        # Drop zero coefficients: CPXchgcoeflist discarded them, but
+        # CPXaddrows would store them as structural nonzeros, changing the
+        # output of row().
+        nz = 0
+        for 0<= i < n:
+            if c_coeff[i] != 0.0:
+                c_coeff[nz] = c_coeff[i]
+                c_indices[nz] = c_indices[i]
+                nz += 1
 
         if upper_bound is None and lower_bound is None:
             pass
@@ -660,16 +822,208 @@ cdef class CPLEXBackend(GenericBackend):
             name = str_to_bytes(name)
             c_name = name
 
-        status = CPXnewrows(self.env, self.lp, 1, &bound, &sense, &rng, NULL if (name is None) else &c_name)
+        # A single CPXaddrows transaction creates the row together with its
+        # coefficients, instead of CPXnewrows followed by CPXchgcoeflist.
+        # Only the range value of an 'R' row cannot be passed this way.
+        cdef char ** c_rowname = NULL
+        if name is not None:
+            c_rowname = &c_name
 
+        with nogil:
+            status = CPXaddrows(self.env, self.lp, 0, 1, nz, &bound, &sense,
+                                &rmatbeg, c_indices, c_coeff, NULL, c_rowname)
         check(status)
-        status = CPXchgcoeflist(self.env, self.lp, n, c_row, c_indices, c_coeff)
-        check(status)
+
+        if sense == 'R':
+            status = CPXchgrngval(self.env, self.lp, 1, &nrows, &rng)
+            check(status)
 
         # Free memory
         sig_free(c_coeff)
         sig_free(c_indices)
-        sig_free(c_row)
+
+    cpdef _add_linear_constraint_mv(self, int[::1] indices, double[::1] coeffs, lower_bound, upper_bound, name=None) noexcept:
+        """
+        Add a linear constraint given as a pair of contiguous arrays.
+
+        This is a fast path equivalent to :meth:`add_linear_constraint`:
+        because ``indices`` and ``coeffs`` arrive as typed memoryviews,
+        they are handed to CPLEX without a Python-object conversion per
+        coefficient.
+
+        INPUT:
+
+        - ``indices`` - variable indices, as a C-contiguous buffer of
+          machine ints (e.g. ``array('i', ...)``)
+
+        - ``coeffs`` - the corresponding coefficients, as a C-contiguous
+          buffer of doubles (e.g. ``array('d', ...)``)
+
+        - ``lower_bound`` - a lower bound, either a real value or ``None``
+
+        - ``upper_bound`` - an upper bound, either a real value or ``None``
+
+        - ``name`` - an optional name for this row (default: ``None``)
+
+        EXAMPLES::
+
+            sage: from array import array
+            sage: from sage_numerical_backends_cplex.cplex_backend import CPLEXBackend
+            sage: p = CPLEXBackend()
+            sage: p.add_variables(5)
+            4
+            sage: p._add_linear_constraint_mv(array('i', range(5)), array('d', range(5)), 2.0, 2.0)
+            sage: p.row(0)
+            ([1, 2, 3, 4], [1.0, 2.0, 3.0, 4.0])
+            sage: p.row_bounds(0)
+            (2.0, 2.0)
+        """
+        if lower_bound is None and upper_bound is None:
+            raise ValueError("At least one of 'upper_bound' or 'lower_bound' must be set.")
+        if indices.shape[0] != coeffs.shape[0]:
+            raise ValueError("'indices' and 'coeffs' must have the same length.")
+
+        self._invalidate_solution_cache()
+
+        cdef int status
+        cdef int i
+        cdef int n = <int> indices.shape[0]
+        cdef int nz = 0
+        cdef int nrows = self.nrows()
+        cdef int rmatbeg = 0
+        cdef char sense
+        cdef char * c_name
+        cdef char ** c_rowname = NULL
+        cdef double bound
+        cdef double rng
+
+        if upper_bound == lower_bound:
+            sense = 'E'
+            bound = lower_bound
+
+        elif upper_bound is not None and lower_bound is not None:
+            if  upper_bound < lower_bound:
+                raise ValueError("The upper bound must be at least equal to the lower bound !")
+
+            sense = 'R'
+            bound = lower_bound
+            rng = upper_bound - lower_bound
+
+        elif upper_bound is not None:
+            sense = 'L'
+            bound = upper_bound
+
+        elif lower_bound is not None:
+            sense = 'G'
+            bound = lower_bound
+
+        if name:
+            name = str_to_bytes(name)
+            c_name = name
+            c_rowname = &c_name
+
+        # Drop zero coefficients for parity with add_linear_constraint
+        # (CPXchgcoeflist discarded them, CPXaddrows would store them as
+        # structural nonzeros).  The caller's buffers are passed through
+        # untouched when there is nothing to drop.
+        for 0<= i < n:
+            if coeffs[i] != 0.0:
+                nz += 1
+
+        cdef int * c_ind = NULL
+        cdef double * c_val = NULL
+        if nz != n:
+            c_ind = <int *> sig_malloc(nz * sizeof(int))
+            c_val = <double *> sig_malloc(nz * sizeof(double))
+            nz = 0
+            for 0<= i < n:
+                if coeffs[i] != 0.0:
+                    c_ind[nz] = indices[i]
+                    c_val[nz] = coeffs[i]
+                    nz += 1
+
+        with nogil:
+            if c_ind != NULL:
+                status = CPXaddrows(self.env, self.lp, 0, 1, nz, &bound, &sense,
+                                    &rmatbeg, c_ind, c_val, NULL, c_rowname)
+            else:
+                status = CPXaddrows(self.env, self.lp, 0, 1, n, &bound, &sense,
+                                    &rmatbeg, &indices[0] if n else NULL,
+                                    &coeffs[0] if n else NULL, NULL, c_rowname)
+
+        sig_free(c_ind)
+        sig_free(c_val)
+        check(status)
+
+        if sense == 'R':
+            status = CPXchgrngval(self.env, self.lp, 1, &nrows, &rng)
+            check(status)
+
+    cpdef add_linear_constraints_matrix(self, int[::1] rmatbeg, int[::1] rmatind, double[::1] rmatval, double[::1] rhs, senses) noexcept:
+        """
+        Add a block of linear constraints given in CSR form.
+
+        The arguments mirror those of ``CPXaddrows``: row ``i`` consists
+        of the entries ``rmatind[rmatbeg[i]:rmatbeg[i+1]]`` /
+        ``rmatval[rmatbeg[i]:rmatbeg[i+1]]``, with right hand side
+        ``rhs[i]`` and sense ``senses[i]``.  All rows are loaded in a
+        single CPLEX transaction with the GIL released.
+
+        INPUT:
+
+        - ``rmatbeg`` - for each row, the position of its first entry in
+          ``rmatind``/``rmatval`` (C-contiguous buffer of machine ints)
+
+        - ``rmatind`` - variable indices of the nonzero entries
+
+        - ``rmatval`` - the corresponding coefficients (buffer of doubles)
+
+        - ``rhs`` - the right hand sides (buffer of doubles)
+
+        - ``senses`` - string with one character per row: ``'E'``
+          (equality), ``'L'`` (at most ``rhs``) or ``'G'`` (at least
+          ``rhs``)
+
+        EXAMPLES::
+
+            sage: from array import array
+            sage: from sage_numerical_backends_cplex.cplex_backend import CPLEXBackend
+            sage: p = CPLEXBackend()
+            sage: p.add_variables(2)
+            1
+            sage: p.add_linear_constraints_matrix(array('i', [0, 2]), array('i', [0, 1, 0, 1]),
+            ....:                                 array('d', [1, 2, 3, 4]), array('d', [3, 6]), 'LL')
+            sage: p.nrows()
+            2
+            sage: p.row(1)
+            ([0, 1], [3.0, 4.0])
+            sage: p.row_bounds(0)
+            (None, 3.0)
+        """
+        cdef int rcnt = <int> rhs.shape[0]
+        cdef int nzcnt = <int> rmatval.shape[0]
+        cdef int status
+
+        if rmatbeg.shape[0] != rcnt:
+            raise ValueError("'rmatbeg' and 'rhs' must have the same length.")
+        if rmatind.shape[0] != nzcnt:
+            raise ValueError("'rmatind' and 'rmatval' must have the same length.")
+        if len(senses) != rcnt:
+            raise ValueError("'senses' must have one character per row.")
+
+        if not rcnt:
+            return
+
+        self._invalidate_solution_cache()
+
+        senses = str_to_bytes(senses) if not isinstance(senses, bytes) else senses
+        cdef char * c_senses = senses
+
+        with nogil:
+            status = CPXaddrows(self.env, self.lp, 0, rcnt, nzcnt, &rhs[0], c_senses,
+                                &rmatbeg[0], &rmatind[0] if nzcnt else NULL,
+                                &rmatval[0] if nzcnt else NULL, NULL, NULL)
+        check(status)
 
     cpdef row(self, int index) noexcept:
         r"""
@@ -844,6 +1198,8 @@ cdef class CPLEXBackend(GenericBackend):
             5
         """
 
+        self._invalidate_solution_cache()
+
         cdef list list_indices
         cdef list list_coeffs
 
@@ -871,9 +1227,9 @@ cdef class CPLEXBackend(GenericBackend):
         cdef int * c_indices = <int *> sig_malloc(n * sizeof(int))
         cdef int * c_col = <int *> sig_malloc(n * sizeof(int))
 
+        cplex_fast_fill_lists(list_indices, list_coeffs, c_indices, c_coeff)
+
         for 0<= i < n:
-            c_coeff[i] = list_coeffs[i]
-            c_indices[i] = list_indices[i]
             c_col[i] = ncols
 
 
@@ -923,12 +1279,16 @@ cdef class CPLEXBackend(GenericBackend):
         cdef int ptype
         cdef int solnmethod_p, solntype_p, pfeasind_p, dfeasind_p
 
+        self._invalidate_solution_cache()
+
         ptype = CPXgetprobtype(self.env, self.lp)
 
         if ptype == 1:
-            status = CPXmipopt(self.env, self.lp)
+            with nogil:
+                status = CPXmipopt(self.env, self.lp)
         elif ptype == 0:
-            status = CPXlpopt(self.env, self.lp)
+            with nogil:
+                status = CPXlpopt(self.env, self.lp)
         else:
             raise MIPSolverException("CPLEX: Unknown problem type")
 
@@ -936,6 +1296,7 @@ cdef class CPLEXBackend(GenericBackend):
 
         stat = CPXgetstat(self.env, self.lp)
         if stat == CPX_STAT_OPTIMAL or stat == CPXMIP_OPTIMAL:
+            self._refresh_solution_cache()
             return 0
         elif stat == CPX_STAT_INFEASIBLE or stat == CPXMIP_INFEASIBLE:
             raise MIPSolverException("CPLEX: The problem has no feasible solution")
@@ -956,6 +1317,7 @@ cdef class CPLEXBackend(GenericBackend):
         if solntype_p == CPX_NO_SOLN or not pfeasind_p:
             raise MIPSolverException("CPLEX: No solution known to be primal feasible is available")
 
+        self._refresh_solution_cache()
         return 0
 
     cpdef get_objective_value(self) noexcept:
@@ -1112,8 +1474,11 @@ cdef class CPLEXBackend(GenericBackend):
         cdef int zero
         cdef char ctype
         cdef double value
-        status = CPXgetx(self.env, self.lp, &value, variable, variable)
-        check(status)
+        if self._x_cache_valid and 0 <= variable < self._x_cache_n:
+            value = self._x_cache[variable]
+        else:
+            status = CPXgetx(self.env, self.lp, &value, variable, variable)
+            check(status)
 
         status = CPXgetctype(self.env, self.lp, &ctype, variable, variable)
 
@@ -1393,6 +1758,7 @@ cdef class CPLEXBackend(GenericBackend):
             return ub if ub < CPX_INFBOUND else None
 
         else:
+            self._invalidate_solution_cache()
             x = 'U'
             c_value = value if value is not None else +CPX_INFBOUND
             status = CPXchgbds(self.env, self.lp, 1, &index, &x, &c_value)
@@ -1445,6 +1811,7 @@ cdef class CPLEXBackend(GenericBackend):
             return None if lb <= -CPX_INFBOUND else lb
 
         else:
+            self._invalidate_solution_cache()
             x = 'L'
             c_value = value if value is not None else -CPX_INFBOUND
             status = CPXchgbds(self.env, self.lp, 1, &index, &x, &c_value)
@@ -1670,12 +2037,44 @@ cdef class CPLEXBackend(GenericBackend):
         """
         cdef int status
 
+        sig_free(self._x_cache)
+
         if self.lp != NULL:
             status = CPXfreeprob(self.env, &self.lp)
 
         if self.env != NULL:
             status = CPXcloseCPLEX(&self.env)
 
+cpdef CPLEXBackend new_backend() noexcept:
+    r"""
+    Return a new :class:`CPLEXBackend`.
+
+    This factory can be called at C level (``cimport`` it from
+    ``cplex_backend.pxd``), so dispatchers that create many backends -
+    e.g. a sweep of thousands of small solves - bypass the Python
+    attribute lookup and ``type.__call__`` machinery of the usual
+    class-based instantiation.  The returned backend is fully
+    initialized, with its CPLEX environment and problem already created.
+
+    EXAMPLES::
+
+        sage: from sage_numerical_backends_cplex.cplex_backend import new_backend
+        sage: p = new_backend()
+        sage: p.ncols()
+        0
+    """
+    return CPLEXBackend()
+
+cdef CPLEXBackend _make_cplex_backend() with gil:
+    return CPLEXBackend()
+
+# C function pointer to the factory, for dispatchers that prefer a single
+# indirect call over import/getattr machinery.  The capsule's name follows
+# the convention "<module>.<attribute>".
+cplex_factory = PyCapsule_New(
+    <void *> _make_cplex_backend,
+    "sage_numerical_backends_cplex.cplex_backend.cplex_factory", NULL)
+
 cdef check(number):
     r"""
     Given a number, raises the corresponding exception or does nothing
@@ -7,8 +7,11 @@ import subprocess
 from setuptools import setup
 from setuptools import Extension
 from setuptools.command.test import test as TestCommand # for tests
-from Cython.Build import cythonize
-from Cython.Compiler.Errors import CompileError
+try:
+    from Cython.Build import cythonize
+    from Cython.Compiler.Errors import CompileError
+except ImportError:
+    cythonize = None
 from codecs import open # To open the README file with proper encoding
 from sage.env import sage_include_directories
 
@@ -18,14 +21,19 @@ class SageTest(TestCommand):
         # Passing optional=sage avoids using sage.misc.package.list_packages,
         # which gives an error on Debian unstable as of 2019-12-27:
         # FileNotFoundError: [Errno 2] No such file or directory: '/usr/share/sagemath/build/pkgs'
-        errno = os.system("PYTHONPATH=`pwd` sage -t --force-lib --optional=sage sage_numerical_backends_cplex")
-        if errno != 0:
+        # subprocess.run avoids the intermediate shell of os.system and
+        # reports the child's exit status (including signals) directly.
+        cp = subprocess.run(['sage', '-t', '--force-lib', '--optional=sage',
+                             'sage_numerical_backends_cplex'],
+                            env={**os.environ, 'PYTHONPATH': os.getcwd()})
+        if cp.returncode != 0:
             sys.exit(1)
 
 class SageTestSage(SageTest):
     def run_tests(self):
-        errno = os.system("PYTHONPATH=`pwd` sage -c 'load(\"check_sage_testsuite.py\")'")
-        if errno != 0:
+        cp = subprocess.run(['sage', '-c', 'load("check_sage_testsuite.py")'],
+                            env={**os.environ, 'PYTHONPATH': os.getcwd()})
+        if cp.returncode != 0:
             sys.exit(1)
 
 # Get information from separate files (README, VERSION)
@@ -49,10 +57,22 @@ if cplex_home:
     cplex_include_directories.append(os.path.join(cplex_home, "cplex", "include", "ilcplex"))
     libdir = os.path.join(cplex_home, "cplex", "bin", cplex_platform)
     cplex_lib_directories.append(libdir)
-    from fnmatch import fnmatch
-    for file in os.listdir(libdir):
-        if any(fnmatch(file, 'libcplex[0-9]*[0-9].' + ext) for ext in exts):
-            cplex_libs = [os.path.splitext(file)[0][3:]]
+    cplex_lib_name = os.getenv("CPLEX_LIB_NAME")
+    if cplex_lib_name:
+        # Skip the directory scan entirely (it can be slow on NFS-mounted
+        # CPLEX installations) when the caller already knows the name
+        # passed to -l, e.g. CPLEX_LIB_NAME=cplex1210.
+        cplex_libs = [cplex_lib_name]
+    else:
+        from fnmatch import fnmatch
+        patterns = ['libcplex[0-9]*[0-9].' + ext for ext in exts]
+        # os.scandir returns dirents without a stat call per entry, and we
+        # stop at the first matching library.
+        with os.scandir(libdir) as it:
+            for entry in it:
+                if any(fnmatch(entry.name, pattern) for pattern in patterns):
+                    cplex_libs = [os.path.splitext(entry.name)[0][3:]]
+                    break
 
 if not cplex_libs:
     print("CPLEX_HOME is not set, or it does not point to a directory with a "
@@ -62,42 +82,127 @@ else:
     print("Using cplex_include_directories={}, libraries={}, library_dirs={}".format(
         cplex_include_directories, cplex_libs, cplex_lib_directories), file=sys.stderr)
 
+# Optimization flags for the compiled extension.  The hot paths (marshalling
+# of coefficient/index arrays for CPXaddrows/CPXchgcoeflist) benefit from
+# vectorization and from LTO inlining the small Cython helpers.
+if sys.platform == 'win32':
+    extra_compile_args = ['/O2', '/GL']
+    extra_link_args = ['/LTCG']
+else:
+    extra_compile_args = ['-O3', '-funroll-loops', '-flto',
+                          '-fno-semantic-interposition']
+    extra_link_args = ['-flto']
+    if not os.getenv('CIBUILDWHEEL'):
+        # -march=native would pin a published wheel to the CI runner's CPU
+        # (SIGILL on older machines), so only use it when the build runs on
+        # the machine that will execute the code.
+        extra_compile_args.insert(1, '-march=native')
+
+# Profile-guided optimization (GCC/Clang only).  Build the extension twice:
+#
+#   SAGE_CPLEX_PGO=generate sage setup.py build_ext --inplace --force
+#   sage -python check_get_solver_with_name.py   # or any representative workload
+#   SAGE_CPLEX_PGO=use sage setup.py build_ext --inplace --force
+#
+# The first build instruments the extension and writes profile data to ./pgo;
+# the second uses it to lay out the hot marshalling paths as fall-through.
+pgo = os.getenv('SAGE_CPLEX_PGO')
+if pgo and os.getenv('CIBUILDWHEEL'):
+    raise ValueError("SAGE_CPLEX_PGO cannot be used when building wheels with "
+                     "cibuildwheel: the profile would be specific to the CI runner")
+if pgo and sys.platform != 'win32':
+    pgo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pgo')
+    if pgo == 'generate':
+        extra_compile_args.append('-fprofile-generate=' + pgo_dir)
+        extra_link_args.append('-fprofile-generate=' + pgo_dir)
+    elif pgo == 'use':
+        extra_compile_args += ['-fprofile-use=' + pgo_dir, '-fprofile-correction']
+        extra_link_args.append('-fprofile-use=' + pgo_dir)
+    else:
+        raise ValueError("SAGE_CPLEX_PGO must be 'generate' or 'use', got {!r}".format(pgo))
+
  # Cython modules
 ext_modules = [Extension('sage_numerical_backends_cplex.cplex_backend',
                          sources = [os.path.join('sage_numerical_backends_cplex',
-                                     'cplex_backend.pyx')],
-                         include_dirs=sage_include_directories() + cplex_include_directories,
+                                     'cplex_backend.pyx'),
+                                    os.path.join('sage_numerical_backends_cplex',
+                                     '_cplex_fast.c')],
+                         include_dirs=sage_include_directories() + cplex_include_directories
+                                      + ['sage_numerical_backends_cplex'],
                          libraries=cplex_libs,
                          library_dirs=cplex_lib_directories,
-                         extra_link_args=['-Wl,-rpath,' + dir for dir in cplex_lib_directories])
+                         define_macros=[('CYTHON_WITHOUT_ASSERTIONS', '1')],
+                         extra_compile_args=extra_compile_args,
+                         extra_link_args=extra_link_args
+                                         + ['-Wl,-rpath,' + dir for dir in cplex_lib_directories])
     ]
 
 
-## SageMath 8.1 (included in Ubuntu bionic 18.04 LTS) does not have sage.cpython.string;
-## it was introduced in 8.2.
-compile_time_env = {'HAVE_SAGE_CPYTHON_STRING': False,
-                    'HAVE_ADD_COL_UNTYPED_ARGS': False}
+# Run the (slow) configuration probes and the Cython compiler only for
+# commands that build the extension; egg_info and friends do not need them
+# and become near-instant.  The test commands run build_ext --inplace
+# first, and sdist must cythonize so that the shipped pre-generated .c
+# actually exists.
+build_commands = {'build', 'build_ext', 'bdist_wheel', 'install', 'develop',
+                  'test', 'check_sage_testsuite', 'sdist'}
 
-print("Checking whether HAVE_SAGE_CPYTHON_STRING...", file=sys.stderr)
-try:
-    import sage.cpython.string
-    compile_time_env['HAVE_SAGE_CPYTHON_STRING'] = True
-except ImportError:
-    pass
+if cythonize is not None and build_commands.intersection(sys.argv):
 
-## SageMath 8.7 changed the signature of add_col.
-print("Checking whether HAVE_ADD_COL_UNTYPED_ARGS...", file=sys.stderr)
-try:
-    cythonize(Extension('check_add_col_untyped_args',
-                        sources=['check_add_col_untyped_args.pyx'],
-                        include_dirs=sage_include_directories()),
-              quiet=True,
-              include_path=sys.path)
-    compile_time_env['HAVE_ADD_COL_UNTYPED_ARGS'] = True
-except CompileError:
-    pass
+    ## SageMath 8.1 (included in Ubuntu bionic 18.04 LTS) does not have sage.cpython.string;
+    ## it was introduced in 8.2.
+    compile_time_env = {'HAVE_SAGE_CPYTHON_STRING': False,
+                        'HAVE_ADD_COL_UNTYPED_ARGS': False}
 
-print("Using compile_time_env: {}".format(compile_time_env), file=sys.stderr)
+    print("Checking whether HAVE_SAGE_CPYTHON_STRING...", file=sys.stderr)
+    try:
+        import sage.cpython.string
+        compile_time_env['HAVE_SAGE_CPYTHON_STRING'] = True
+    except ImportError:
+        pass
+
+    ## SageMath 8.7 changed the signature of add_col.
+    print("Checking whether HAVE_ADD_COL_UNTYPED_ARGS...", file=sys.stderr)
+    try:
+        cythonize(Extension('check_add_col_untyped_args',
+                            sources=['check_add_col_untyped_args.pyx'],
+                            include_dirs=sage_include_directories()),
+                  quiet=True,
+                  include_path=sys.path)
+        compile_time_env['HAVE_ADD_COL_UNTYPED_ARGS'] = True
+    except CompileError:
+        pass
+
+    print("Using compile_time_env: {}".format(compile_time_env), file=sys.stderr)
+
+    # Cython compiler directives.  Bounds/wraparound/initialized checks add a
+    # branch per element in the loops that fill CPLEX's index/coefficient
+    # arrays and block their vectorization.  With boundscheck off, indexing
+    # is unchecked, so the public entry points that index Python lists with
+    # a C counter validate the list lengths before their fill loops run.
+    cython_directives = {'boundscheck': False,
+                         'wraparound': False,
+                         'initializedcheck': False,
+                         'nonecheck': False,
+                         'overflowcheck': False,
+                         'cdivision': True,
+                         'infer_types': True,
+                         'language_level': 3}
+
+    # force=False lets cythonize skip regeneration when the shipped .c file
+    # is newer than the .pyx/.pxd sources; nthreads translates the modules
+    # in parallel.
+    ext_modules = cythonize(ext_modules, include_path=sys.path,
+                            force=False,
+                            nthreads=max(1, os.cpu_count() or 1),
+                            compile_time_env=compile_time_env,
+                            compiler_directives=cython_directives)
+else:
+    # Without Cython (e.g. an end-user install from an sdist that ships the
+    # generated file), compile the pre-generated .c directly.
+    for ext in ext_modules:
+        ext.sources = [os.path.splitext(source)[0] + '.c'
+                       if source.endswith('.pyx') else source
+                       for source in ext.sources]
 
 setup(
     name="sage_numerical_backends_cplex",
@@ -127,8 +232,9 @@ setup(
                  'Programming Language :: Python :: 3.11',
                  'Programming Language :: Python :: 3.12',
                  ],
-    ext_modules = cythonize(ext_modules, include_path=sys.path,
-                            compile_time_env=compile_time_env),
+    ext_modules = ext_modules,
+    # Compile the generated C sources concurrently.
+    options = {'build_ext': {'parallel': os.cpu_count()}},
     cmdclass = {'test': SageTest, 'check_sage_testsuite': SageTestSage}, # adding a special setup command for tests
     keywords=['milp', 'linear-programming', 'optimization'],
     packages=['sage_numerical_backends_cplex'],